@@ -1,10 +1,19 @@
 """Simple PubMed Connector Implementation."""
 
+import asyncio
+import copy
+import io
 import logging
+import re
+import weakref
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+from xml.etree.ElementTree import Element  # nosec B405 - type only; parsing uses defusedxml
+
+from defusedxml.ElementTree import iterparse
 
 from obc_connector_sdk.base_connector import BaseConnector
+from obc_connector_sdk.utils.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -12,18 +21,32 @@ logger = logging.getLogger(__name__)
 class PubMedConnector(BaseConnector):
     """Simple PubMed connector without YAML complexity."""
 
+    # EFetch accepts up to 200 IDs per request
+    EFETCH_BATCH_SIZE = 200
+    # ...and up to 10,000 records per request from the history server
+    EFETCH_HISTORY_BATCH_SIZE = 10000
+
+    _PMID_RE = re.compile(r"[0-9]+")
+
+    # Element paths, relative to <PubmedArticle>
+    _AUTHOR_LIST_PATH = "MedlineCitation/Article/AuthorList"
+    _PUB_DATE_PATH = "MedlineCitation/Article/Journal/JournalIssue/PubDate"
+    _DOI_PATH = "PubmedData/ArticleIdList/ArticleId[@IdType='doi']"
+
     def __init__(self):
         super().__init__(
             base_url="https://eutils.ncbi.nlm.nih.gov/entrez/eutils/",
             rate_limit=3,  # PubMed rate limit
         )
+        self.api_key: Optional[str] = None
+        self._rate_limiter: Optional[RateLimiter] = None
+        self._rate_limiter_loop: Optional["weakref.ReferenceType[asyncio.AbstractEventLoop]"] = None
 
     async def search(self, query: str, limit: int = 100) -> Dict[str, Any]:
         """Search PubMed for papers."""
-        params = {"db": "pubmed", "term": query, "retmax": limit, "retmode": "json"}
-
         try:
-            response = await self.make_request("esearch.fcgi", params)
+            # Keep the result set on NCBI's history server so it can be fetched in bulk
+            response = await self._esearch(term=query, retmax=limit, usehistory="y")
 
             # Extract paper IDs
             paper_ids = self.extract_list(response, "esearchresult.idlist")
@@ -33,7 +56,11 @@ class PubMedConnector(BaseConnector):
                 "query": query,
                 "total_results": total_count,
                 "document_ids": paper_ids,
-                "metadata": {"db": "pubmed"},
+                "metadata": {
+                    "db": "pubmed",
+                    "webenv": self.extract_text(response, "esearchresult.webenv"),
+                    "query_key": self.extract_text(response, "esearchresult.querykey"),
+                },
             }
         except Exception as e:
             logger.error(f"Search failed: {e}")
@@ -44,45 +71,231 @@ class PubMedConnector(BaseConnector):
                 "metadata": {"db": "pubmed", "error": str(e)},
             }
 
+    async def search_and_fetch(self, query: str, limit: int = 100) -> Dict[str, Any]:
+        """Search PubMed and fetch the matching papers.
+
+        Uses the E-utilities history server: ESearch stores the result set and
+        EFetch pulls it back by WebEnv/query_key, so up to 10,000 papers take two
+        requests instead of one per paper.
+
+        Returns a dict with "query", "total_results", "documents" (the parsed
+        papers) and "metadata", like search() but with documents in place of
+        "document_ids". If a request fails, or ESearch reports an error, the
+        papers fetched before it are kept and the error is in metadata["error"].
+        """
+        papers: List[Dict[str, Any]] = []
+        total_count = 0
+        metadata: Dict[str, Any] = {"db": "pubmed"}
+
+        try:
+            response = await self._esearch(term=query, retmax=0, usehistory="y")
+            webenv = self.extract_text(response, "esearchresult.webenv")
+            query_key = self.extract_text(response, "esearchresult.querykey")
+            total_count = int(self.extract_text(response, "esearchresult.count") or 0)
+            if total_count and (not webenv or not query_key):
+                raise ValueError("ESearch did not return a history server session")
+
+            for retstart in range(0, min(limit, total_count), self.EFETCH_HISTORY_BATCH_SIZE):
+                xml_content = await self._efetch(
+                    WebEnv=webenv,
+                    query_key=query_key,
+                    retstart=retstart,
+                    retmax=min(self.EFETCH_HISTORY_BATCH_SIZE, limit - retstart),
+                )
+                papers.extend(self._parse_article(a) for a in self._iter_articles(xml_content))
+        except Exception as e:
+            logger.error(f"Search and fetch failed: {e}")
+            metadata["error"] = str(e)
+
+        return {
+            "query": query,
+            "total_results": total_count,
+            "documents": papers,
+            "metadata": metadata,
+        }
+
     async def get_by_id(self, paper_id: str) -> Dict[str, Any]:
         """Get paper by ID."""
-        params = {"db": "pubmed", "id": paper_id, "retmode": "xml"}
-
         try:
-            # For XML responses, we need to handle them differently
-            url = f"{self.base_url}efetch.fcgi"
-            async with self.http_client.get(url, params=params) as response:
-                response.raise_for_status()
-                xml_content = await response.text()
-
-            # Simple XML parsing - for now return basic info
-            # TODO: Implement proper XML parsing with xml.etree.ElementTree
-            return {
-                "id": paper_id,
-                "title": f"Paper {paper_id}",
-                "abstract": "Abstract not parsed yet",
-                "authors": [],
-                "publication_date": None,
-                "doi": None,
-                "source": "pubmed",
-                "xml_content": xml_content[:500] + "..." if len(xml_content) > 500 else xml_content,
-            }
+            if not self._is_valid_pmid(paper_id):
+                raise ValueError(f"Invalid PubMed ID: {paper_id!r}")
+
+            xml_content = await self._efetch(id=paper_id)
+
+            article = next(self._iter_articles(xml_content), None)
+            if article is None:
+                return {"id": paper_id, "error": "Article not found"}
+
+            return self._parse_article(article, paper_id)
         except Exception as e:
             logger.error(f"Failed to get paper {paper_id}: {e}")
             return {"id": paper_id, "error": str(e)}
 
-    def extract_authors(self, response: Dict[str, Any]) -> List[str]:
-        """Extract authors from response."""
-        authors = self.extract_list(response, "PubmedArticle.Article.AuthorList.Author")
+    async def get_by_ids(self, paper_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several papers, batching IDs into as few EFetch requests as possible.
+
+        Batches are fetched concurrently, paced to the NCBI rate limit. Returns one
+        entry per requested ID, in request order; IDs that are malformed or not
+        found get an error entry, as with get_by_id.
+        """
+        # Reject malformed IDs up front instead of spending a request on them, and
+        # fetch repeated IDs only once
+        valid_ids = list(dict.fromkeys(pid for pid in paper_ids if self._is_valid_pmid(pid)))
+
+        batches = [
+            valid_ids[i : i + self.EFETCH_BATCH_SIZE]
+            for i in range(0, len(valid_ids), self.EFETCH_BATCH_SIZE)
+        ]
+        papers: Dict[str, Dict[str, Any]] = {}
+        for batch in await asyncio.gather(*(self._get_batch(batch) for batch in batches)):
+            papers.update(batch)
+
+        results: List[Dict[str, Any]] = []
+        returned: Set[str] = set()
+        for pid in paper_ids:
+            if not self._is_valid_pmid(pid):
+                results.append({"id": pid, "error": f"Invalid PubMed ID: {pid!r}"})
+            elif pid not in papers:
+                results.append({"id": pid, "error": "Article not found"})
+            elif pid in returned:
+                # Repeated IDs get their own copy so entries can be changed independently
+                results.append(copy.deepcopy(papers[pid]))
+            else:
+                returned.add(pid)
+                results.append(papers[pid])
+        return results
+
+    def _is_valid_pmid(self, paper_id: Any) -> bool:
+        """Check that an ID looks like a PubMed ID (all digits)."""
+        return isinstance(paper_id, str) and self._PMID_RE.fullmatch(paper_id) is not None
+
+    async def _get_batch(self, paper_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get one EFetch batch of papers, keyed by PMID."""
+        try:
+            xml_content = await self._efetch(id=",".join(paper_ids))
+            papers = (self._parse_article(article) for article in self._iter_articles(xml_content))
+            return {paper["id"]: paper for paper in papers}
+        except Exception as e:
+            logger.error(f"Failed to get papers {paper_ids}: {e}")
+            return {paper_id: {"id": paper_id, "error": str(e)} for paper_id in paper_ids}
+
+    async def _throttle(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Wait for the NCBI rate limit and add the API key, if any, to the params."""
+        if self.api_key:
+            params = {**params, "api_key": self.api_key}
+
+        # The limiter's lock is bound to the event loop it is first used on, so a
+        # new limiter is created whenever the connector moves to another loop
+        loop = asyncio.get_running_loop()
+        if self._rate_limiter is None or self._rate_limiter_loop() is not loop:
+            self._rate_limiter = RateLimiter(self.rate_limit)
+            self._rate_limiter_loop = weakref.ref(loop)
+        await self._rate_limiter.acquire()
+        return params
+
+    async def _esearch(self, **params: Any) -> Dict[str, Any]:
+        """Run an ESearch query and return its JSON response.
+
+        Raises ValueError when NCBI answers with an error payload instead of results.
+        """
+        params = await self._throttle({"db": "pubmed", "retmode": "json", **params})
+        response = await self.make_request("esearch.fcgi", params)
+        if not response:
+            raise ValueError("ESearch returned an empty response")
+
+        # Bad queries come back as HTTP 200 with esearchresult.ERROR; invalid API
+        # keys and similar as a top-level "error"
+        error = self.extract_text(response, "esearchresult.ERROR") or response.get("error")
+        if error:
+            raise ValueError(f"ESearch error: {error}")
+        return response
+
+    async def _efetch(self, **params: Any) -> bytes:
+        """Fetch EFetch XML, selecting records by ``id`` or by ``WebEnv``/``query_key``."""
+        params = await self._throttle({"db": "pubmed", "retmode": "xml", **params})
+
+        # For XML responses, we need to handle them differently
+        url = f"{self.base_url}efetch.fcgi"
+        async with self.http_client.get(url, params=params) as response:
+            response.raise_for_status()
+            # Raw bytes: the parser reads the encoding from the XML declaration
+            return await response.read()
+
+    def _iter_articles(self, xml_content: bytes) -> Iterator[Element]:
+        """Stream <PubmedArticle> elements out of an EFetch response.
+
+        Articles are dropped from the tree once the caller moves on, so peak
+        memory stays at one article rather than the whole <PubmedArticleSet>.
+        """
+        events = iterparse(io.BytesIO(xml_content), events=("start", "end"))
+        _, root = next(events)
+        for event, elem in events:
+            if event == "end" and elem.tag == "PubmedArticle":
+                yield elem
+                root.clear()
+
+    def _parse_article(
+        self, article: Element, paper_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build a document dict from a <PubmedArticle> element.
+
+        The children of <Article> are visited in a single pass rather than
+        searching from the root once per field.
+        """
+        title = abstract = publication_date = None
+        authors: List[str] = []
+
+        citation = article.find("MedlineCitation")
+        if citation is not None:
+            paper_id = citation.findtext("PMID") or paper_id
+            for child in citation.iterfind("Article/*"):
+                if child.tag == "ArticleTitle":
+                    title = "".join(child.itertext()).strip()
+                elif child.tag == "Abstract":
+                    abstract = (
+                        " ".join(
+                            "".join(part.itertext()).strip()
+                            for part in child.iterfind("AbstractText")
+                        )
+                        or None
+                    )
+                elif child.tag == "AuthorList":
+                    authors = self._author_names(child)
+                elif child.tag == "Journal":
+                    publication_date = self._publication_date(child.find("JournalIssue/PubDate"))
+
+        return {
+            "id": paper_id,
+            "title": title,
+            "abstract": abstract,
+            "authors": authors,
+            "publication_date": publication_date,
+            "doi": article.findtext(self._DOI_PATH),
+            "source": "pubmed",
+        }
+
+    def _author_names(self, author_list: Optional[Element]) -> List[str]:
+        """Format the <Author> entries of an <AuthorList>."""
+        if author_list is None:
+            return []
         return [
-            f"{author.get('LastName', '')} {author.get('ForeName', '')}".strip()
-            for author in authors
-            if author
+            author.findtext("CollectiveName")
+            or f"{author.findtext('LastName', '')} {author.findtext('ForeName', '')}".strip()
+            for author in author_list.iterfind("Author")
         ]
 
-    def extract_publication_date(self, response: Dict[str, Any]) -> Optional[str]:
-        """Extract publication date from response."""
-        pub_date = self.extract_text(response, "PubmedArticle.Article.Journal.JournalIssue.PubDate")
+    def _publication_date(self, pub_date: Optional[Element]) -> Optional[str]:
+        """Format a <PubDate> element."""
+        if pub_date is None:
+            return None
+        # MedlineDate holds free-form ranges such as "1998 Dec-1999 Jan"
+        parts = (pub_date.findtext(tag) for tag in ("Year", "Month", "Day"))
+        return self._format_publication_date(
+            pub_date.findtext("MedlineDate") or " ".join(part for part in parts if part)
+        )
+
+    def _format_publication_date(self, pub_date: Optional[str]) -> Optional[str]:
+        """Normalise "YYYY Mon DD" dates to ISO format, passing others through."""
         if pub_date:
             try:
                 return datetime.strptime(pub_date, "%Y %b %d").isoformat()
@@ -90,11 +303,36 @@ class PubMedConnector(BaseConnector):
                 return pub_date
         return None
 
+    def extract_authors(self, response: Union[Dict[str, Any], Element]) -> List[str]:
+        """Extract authors from a <PubmedArticle> element or response dict."""
+        if isinstance(response, Element):
+            return self._author_names(response.find(self._AUTHOR_LIST_PATH))
+
+        authors = self.extract_list(response, "PubmedArticle.Article.AuthorList.Author")
+        return [
+            f"{author.get('LastName', '')} {author.get('ForeName', '')}".strip()
+            for author in authors
+            if author
+        ]
+
+    def extract_publication_date(
+        self, response: Union[Dict[str, Any], Element]
+    ) -> Optional[str]:
+        """Extract publication date from a <PubmedArticle> element or response dict."""
+        if isinstance(response, Element):
+            return self._publication_date(response.find(self._PUB_DATE_PATH))
+
+        return self._format_publication_date(
+            self.extract_text(response, "PubmedArticle.Article.Journal.JournalIssue.PubDate")
+        )
+
     async def authenticate(self, config: Dict[str, Any]) -> None:
         """Configure the connector with authentication."""
         # Simple authentication - just store API key if provided
         if config.get("api_key"):
             self.api_key = config["api_key"]
+            self.rate_limit = 10  # NCBI allows 10 requests/second with an API key
+            self._rate_limiter = None
             logger.info("PubMed connector configured with API key")
 
     async def get_updates(self, since: datetime) -> List[Dict[str, Any]]:
@@ -1,32 +1,225 @@
 """Simple base connector without YAML complexity."""
 
+import asyncio
+import functools
+import json
 import logging
+import weakref
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import aiohttp
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dot-notation path into keys, once per distinct path."""
+    return tuple(path.split("."))
+
+
+def _resolve_path(data: Any, path: str) -> Any:
+    """Walk a dot-notation path through nested mappings."""
+    value = data
+    for key in _split_path(path):
+        value = value[key]
+    return value
+
+
+# (connector class, base_url, event loop) a shared session belongs to
+_SessionKey = Tuple[type, str, asyncio.AbstractEventLoop]
+
+
+class _SharedSession:
+    """An aiohttp session shared by the connectors using one API from one event loop."""
+
+    __slots__ = ("session", "loop", "refs", "__weakref__")
+
+    def __init__(
+        self, session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]
+    ):
+        self.session = session
+        # None for a session assigned to http_client outside a coroutine, whose
+        # loop isn't known; it is used as is rather than replaced on loop changes
+        self.loop = loop
+        self.refs = 0
+
+
 class BaseConnector(ABC):
     """Simple base connector with common functionality."""
 
+    # Sessions are shared between instances of a connector class that talk to the
+    # same API so they reuse pooled connections. aiohttp sessions are bound to an
+    # event loop, so the loop is part of the key. Entries are held weakly: they
+    # live only as long as some connector holds the session, so dead loops aren't
+    # kept alive.
+    _shared_sessions: "weakref.WeakValueDictionary[_SessionKey, _SharedSession]" = (
+        weakref.WeakValueDictionary()
+    )
+    # Close tasks for sessions left behind on another event loop
+    _closing_tasks: Set["asyncio.Future[None]"] = set()
+
+    # Set to False in connectors that put per-instance state, such as credentials,
+    # on the session itself; each instance then gets a session of its own
+    share_http_session: bool = True
+
     def __init__(self, base_url: str, rate_limit: int = 10):
         self.base_url = base_url
         self.rate_limit = rate_limit
-        self.http_client = aiohttp.ClientSession()
+        self._shared: Optional[_SharedSession] = None
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    async def make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Make HTTP request with rate limiting."""
+    @property
+    def http_client(self) -> aiohttp.ClientSession:
+        """HTTP session for this connector's API, created on first use.
+
+        aiohttp sessions are bound to the running event loop, so the session is
+        created (or replaced after switching loops) only when this is read inside
+        a coroutine. Outside one, an already created session is returned; before
+        that, AttributeError is raised, so hasattr() reports False.
+
+        Override _new_session to customise how sessions are built, or assign a
+        ready-made session to this property; an assigned session is used by this
+        instance only.
+        """
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        shared = self._shared
+        if (
+            shared is not None
+            and not shared.session.closed
+            and (loop is None or shared.loop in (None, loop))
+        ):
+            return shared.session
+        if loop is None:
+            raise AttributeError(
+                "http_client is created on first use inside a coroutine: "
+                "aiohttp sessions are bound to the running event loop"
+            )
+
+        if shared is not None and shared.loop is not loop:
+            # A session from a previous event loop cannot be reused here
+            stale = self._release_session()
+            if stale is not None:
+                self._schedule_close(stale)
+
+        if self._shared is None:
+            if self.share_http_session:
+                key = (type(self), self.base_url, loop)
+                shared = self._shared_sessions.get(key)
+                if shared is None:
+                    shared = _SharedSession(self._new_session(), loop)
+                    self._shared_sessions[key] = shared
+            else:
+                shared = _SharedSession(self._new_session(), loop)
+            shared.refs += 1
+            self._shared = shared
+
+        if self._shared.session.closed:
+            self._shared.session = self._new_session()
+        return self._shared.session
+
+    @http_client.setter
+    def http_client(self, session: aiohttp.ClientSession) -> None:
+        """Use a custom session for this instance only; it is not shared."""
+        stale = self._release_session()
+        if stale is not None:
+            self._schedule_close(stale)
+
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        self._shared = _SharedSession(session, loop)
+        self._shared.refs = 1
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session; override to customise it (headers, timeouts, ...).
+
+        Sessions are shared between instances of the connector class unless
+        share_http_session is False, so anything instance-specific set here also
+        requires turning sharing off.
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=10, ttl_dns_cache=300)
+        )
+
+    def _release_session(self) -> Optional[_SharedSession]:
+        """Drop this connector's hold on its shared session.
+
+        Returns the shared session when this connector was its last user, so the
+        caller can close it.
+        """
+        shared, self._shared = self._shared, None
+        if shared is None:
+            return None
+
+        shared.refs -= 1
+        if shared.refs > 0:
+            return None
+
+        key = (type(self), self.base_url, shared.loop)
+        if shared.loop is not None and self._shared_sessions.get(key) is shared:
+            del self._shared_sessions[key]
+        return shared
+
+    @classmethod
+    def _schedule_close(cls, shared: _SharedSession) -> None:
+        """Close a released session without awaiting it.
+
+        The close runs on the session's own loop when that loop is still alive,
+        and otherwise on the running loop.
+        """
+        if shared.session.closed:
+            return
+        try:
+            running: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if shared.loop is not None and shared.loop is not running and not shared.loop.is_closed():
+            asyncio.run_coroutine_threadsafe(shared.session.close(), shared.loop)
+        elif running is not None:
+            # If its loop is gone its connections died with it; this only marks it closed
+            task = running.create_task(shared.session.close())
+            cls._closing_tasks.add(task)
+            task.add_done_callback(cls._closing_tasks.discard)
+
+    async def make_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Make HTTP request with rate limiting.
+
+        Per-instance headers such as credentials belong in ``headers``: they are
+        sent with this request only, while the session may be shared with other
+        connector instances.
+
+        Returns the decoded JSON body, or None when the body is empty.
+        """
         url = f"{self.base_url}{endpoint}"
 
         try:
-            async with self.http_client.get(url, params=params) as response:
+            async with self.http_client.get(url, params=params, headers=headers) as response:
                 response.raise_for_status()
-                return await response.json()
+                # Decode the raw body directly; skips aiohttp's text decoding step
+                body = await response.read()
+                # Like response.json(), an empty body means no data rather than an error
+                if not body.strip():
+                    return None
+                return _json_loads(body)
         except Exception as e:
             self.logger.error(f"Request failed: {e}")
             raise
@@ -34,10 +227,7 @@ class BaseConnector(ABC):
     def extract_text(self, data: Dict[str, Any], path: str) -> Optional[str]:
         """Extract text from response using dot notation."""
         try:
-            keys = path.split(".")
-            value = data
-            for key in keys:
-                value = value[key]
+            value = _resolve_path(data, path)
             return str(value) if value is not None else None
         except (KeyError, TypeError):
             return None
@@ -45,10 +235,7 @@ class BaseConnector(ABC):
     def extract_list(self, data: Dict[str, Any], path: str) -> List[str]:
         """Extract list from response using dot notation."""
         try:
-            keys = path.split(".")
-            value = data
-            for key in keys:
-                value = value[key]
+            value = _resolve_path(data, path)
             return value if isinstance(value, list) else []
         except (KeyError, TypeError):
             return []
@@ -64,13 +251,17 @@ class BaseConnector(ABC):
         pass
 
     async def close(self):
-        """Close HTTP client."""
-        await self.http_client.close()
+        """Release HTTP client, closing it once no other connector is using it."""
+        shared = self._release_session()
+        if shared is None or shared.session.closed:
+            return
+        if shared.loop in (None, asyncio.get_running_loop()):
+            await shared.session.close()
+        else:
+            self._schedule_close(shared)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        import asyncio
-
         asyncio.create_task(self.close())
@@ -137,7 +137,9 @@ class ConnectorCapability(Enum):
                 ...
             }
         """
-        return {cap.value: (cap in capabilities) for cap in cls}
+        result = _ALL_FALSE.copy()
+        result.update({cap.value: True for cap in capabilities})
+        return result
         
     @classmethod
     def validate_content_type_capability(cls, capabilities: set["ConnectorCapability"]) -> bool:
@@ -155,10 +157,16 @@ class ConnectorCapability(Enum):
             >>> ConnectorCapability.validate_content_type_capability(caps)
             True
         """
-        content_type_capabilities = {
-            cls.SUPPORTS_DOCUMENT_CONTENT,
-            cls.SUPPORTS_JSON_CONTENT,
-            cls.SUPPORTS_STRING_CONTENT,
-            cls.SUPPORTS_BINARY_CONTENT
-        }
-        return bool(capabilities & content_type_capabilities) 
\ No newline at end of file
+        return not _CONTENT_CAPS.isdisjoint(capabilities)
+
+
+# Every capability switched off; to_dict copies this and flips the active ones
+_ALL_FALSE: Dict[str, bool] = {cap.value: False for cap in ConnectorCapability}
+
+# Content type capabilities, built once for validate_content_type_capability
+_CONTENT_CAPS: frozenset = frozenset({
+    ConnectorCapability.SUPPORTS_DOCUMENT_CONTENT,
+    ConnectorCapability.SUPPORTS_JSON_CONTENT,
+    ConnectorCapability.SUPPORTS_STRING_CONTENT,
+    ConnectorCapability.SUPPORTS_BINARY_CONTENT
+})
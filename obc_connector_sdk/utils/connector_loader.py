@@ -1,19 +1,36 @@
 """Utilities for dynamically loading and managing connectors."""
 
+import copy
+import functools
 import importlib
+import json
 import logging
 import os
 from contextlib import asynccontextmanager
-from typing import Any, Dict, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import yaml
 
 from ..base_connector import BaseConnector
 from ..exceptions import ConnectorError
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _load_spec_cached(spec_path: str, mtime_ns: int) -> Any:
+    """Parse a connector spec file (YAML or compiled JSON) once per modification time."""
+    with open(spec_path) as f:
+        if spec_path.endswith(".json"):
+            return json.load(f)
+        return yaml.load(f, Loader=SafeLoader)
+
+
 class ConnectorLoader:
     """Utility class for loading and managing connectors."""
 
@@ -26,10 +43,68 @@ class ConnectorLoader:
         lambda: os.getenv("obc_CONNECTORS_PATH"),
     ]
 
+    # Connector name -> directory, built from the search paths it was scanned with
+    _dir_index: Dict[str, str] = {}
+    _dir_index_paths: Optional[List[str]] = None
+
     @classmethod
     def _get_search_paths(cls) -> list[str]:
         """Get list of valid connector search paths."""
-        return [path() for path in cls.CONNECTOR_PATHS if path() is not None]
+        paths = (path() for path in cls.CONNECTOR_PATHS)
+        return [path for path in paths if path is not None]
+
+    @classmethod
+    def _read_yaml(cls, yaml_path: str) -> Any:
+        """Read connector.yaml, reusing the parsed result while the file is unchanged.
+
+        A compiled connector.json next to it is used instead when it is at least
+        as new as the YAML file (see compile_spec).
+        """
+        yaml_mtime_ns = os.stat(yaml_path).st_mtime_ns
+        json_path = os.path.splitext(yaml_path)[0] + ".json"
+        try:
+            json_mtime_ns = os.stat(json_path).st_mtime_ns
+        except FileNotFoundError:
+            json_mtime_ns = None
+
+        if json_mtime_ns is not None and json_mtime_ns >= yaml_mtime_ns:
+            return _load_spec_cached(json_path, json_mtime_ns)
+        return _load_spec_cached(yaml_path, yaml_mtime_ns)
+
+    @classmethod
+    def compile_spec(cls, connector_dir: str) -> str:
+        """Write connector.json next to connector.yaml so it loads without YAML parsing.
+
+        Args:
+            connector_dir: Path to the connector directory
+
+        Returns:
+            Path to the written connector.json
+
+        Raises:
+            ConnectorError: If YAML is missing or cannot be represented exactly as
+                JSON; no file is written in that case
+        """
+        yaml_path = os.path.join(connector_dir, "connector.yaml")
+        if not os.path.exists(yaml_path):
+            raise ConnectorError(f"connector.yaml not found in {connector_dir}")
+
+        json_path = os.path.join(connector_dir, "connector.json")
+        try:
+            with open(yaml_path) as f:
+                spec = yaml.load(f, Loader=SafeLoader)
+            # Serialise before opening the target so a failure leaves no partial file
+            content = json.dumps(spec, indent=2)
+            # The loader prefers connector.json, so it must load back to exactly the
+            # same spec. JSON can't express everything YAML can (e.g. non-string keys)
+            if json.loads(content) != spec:
+                raise ConnectorError("spec does not survive a round trip through JSON")
+            with open(json_path, "w") as f:
+                f.write(content)
+        except Exception as e:
+            raise ConnectorError(f"Error compiling connector.yaml: {str(e)}")
+
+        return json_path
 
     @classmethod
     def _get_yaml_version(cls, connector_dir: str) -> str:
@@ -38,11 +113,10 @@ class ConnectorLoader:
         if not os.path.exists(yaml_path):
             raise ConnectorError(f"connector.yaml not found in {connector_dir}")
 
-        with open(yaml_path) as f:
-            spec = yaml.safe_load(f)
-            if not spec.get("version"):
-                raise ConnectorError(f"Version not specified in {yaml_path}")
-            return spec["version"]
+        spec = cls._read_yaml(yaml_path)
+        if not spec.get("version"):
+            raise ConnectorError(f"Version not specified in {yaml_path}")
+        return spec["version"]
 
     @classmethod
     def find_connector_dir(cls, connector_name: str) -> str:
@@ -57,12 +131,41 @@ class ConnectorLoader:
         Raises:
             ConnectorError: If connector directory cannot be found
         """
-        for base_path in cls._get_search_paths():
-            connector_dir = os.path.join(base_path, "connectors", connector_name)
-            if os.path.exists(connector_dir):
-                return connector_dir
+        search_paths = cls._get_search_paths()
+        if search_paths != cls._dir_index_paths or connector_name not in cls._dir_index:
+            cls._build_dir_index(search_paths)
+
+        connector_dir = cls._dir_index.get(connector_name)
+        if connector_dir is None:
+            raise ConnectorError(f"Connector directory not found for: {connector_name}")
+        return connector_dir
+
+    @classmethod
+    def _build_dir_index(cls, search_paths: List[str]) -> None:
+        """Scan each search path once and index connector directories by name.
+
+        Earlier search paths take precedence, matching the lookup order of
+        find_connector_dir.
+        """
+        index: Dict[str, str] = {}
+        for base_path in search_paths:
+            try:
+                with os.scandir(os.path.join(base_path, "connectors")) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            index.setdefault(entry.name, entry.path)
+            except OSError:
+                continue
+
+        cls._dir_index = index
+        cls._dir_index_paths = search_paths
 
-        raise ConnectorError(f"Connector directory not found for: {connector_name}")
+    @classmethod
+    def reload(cls) -> None:
+        """Drop cached connector directories and parsed connector.yaml files."""
+        cls._dir_index = {}
+        cls._dir_index_paths = None
+        _load_spec_cached.cache_clear()
 
     @classmethod
     def load_yaml_spec(cls, connector_dir: str) -> Dict[str, Any]:
@@ -72,7 +175,8 @@ class ConnectorLoader:
             connector_dir: Path to the connector directory
 
         Returns:
-            Parsed and validated YAML specification
+            Parsed and validated YAML specification. This is a private copy, so
+            callers may modify it without affecting later loads.
 
         Raises:
             ConnectorError: If YAML is missing or invalid
@@ -82,14 +186,14 @@ class ConnectorLoader:
             raise ConnectorError(f"connector.yaml not found in {connector_dir}")
 
         try:
-            with open(yaml_path) as f:
-                spec = yaml.safe_load(f)
+            spec = cls._read_yaml(yaml_path)
 
             # Validate required fields
             if not spec.get("name"):
                 raise ConnectorError("Invalid connector.yaml: 'name' field missing")
 
-            return spec
+            # Deep copy: nested sections are shared with the cached parse
+            return copy.deepcopy(spec)
         except Exception as e:
             raise ConnectorError(f"Error loading connector.yaml: {str(e)}")
 
@@ -167,9 +271,7 @@ class ConnectorLoader:
         try:
             yield connector
         finally:
-            if hasattr(connector, "http_client") and connector.http_client:
-                await connector.http_client.close()
-            elif hasattr(connector, "close"):
+            if hasattr(connector, "close"):
                 await connector.close()
 
     @classmethod
@@ -9,19 +9,30 @@ class RateLimiter:
     
     def __init__(self, requests_per_second: float):
         self.requests_per_second = requests_per_second
-        self._last_request_time = 0.0
+        # Earliest monotonic time at which the next request may be sent
+        self._next_allowed = 0.0
         self._lock = asyncio.Lock()
     
+    @property
+    def requests_per_second(self) -> float:
+        return self._requests_per_second
+    
+    @requests_per_second.setter
+    def requests_per_second(self, value: float):
+        if value <= 0:
+            raise ValueError(f"requests_per_second must be positive, got {value}")
+        self._requests_per_second = value
+        self._interval = 1.0 / value
+    
     async def acquire(self):
         """Acquire permission to make a request."""
         async with self._lock:
-            current_time = time.time()
-            time_since_last_request = current_time - self._last_request_time
-            min_interval = 1.0 / self.requests_per_second
+            # Monotonic time can't jump backwards with wall-clock adjustments
+            now = time.monotonic()
+            delay = self._next_allowed - now
             
-            if time_since_last_request < min_interval:
+            if delay > 0:
                 # Need to wait
-                wait_time = min_interval - time_since_last_request
-                await asyncio.sleep(wait_time)
+                await asyncio.sleep(delay)
             
-            self._last_request_time = time.time() 
\ No newline at end of file
+            self._next_allowed = max(self._next_allowed, now) + self._interval
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Compile connector YAML files to connector.json for faster loading."""
+
+import os
+import sys
+
+from obc_connector_sdk.exceptions import ConnectorError
+from obc_connector_sdk.utils.connector_loader import ConnectorLoader
+
+
+def main():
+    """Compile every connector.yaml under connectors/."""
+    connectors_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "connectors")
+    exit_code = 0
+
+    for entry in sorted(os.scandir(connectors_dir), key=lambda e: e.name):
+        if not entry.is_dir() or not os.path.isfile(os.path.join(entry.path, "connector.yaml")):
+            continue
+
+        try:
+            json_path = ConnectorLoader.compile_spec(entry.path)
+            print(f"✅ {json_path}")
+        except ConnectorError as e:
+            exit_code = 1
+            print(f"❌ {entry.name}: {e}")
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,14 @@
 """Validate connector YAML files against schema and design guidelines."""
 
 import os
+import re
 import sys
 import json
-import yaml
-import jsonschema
-from typing import Dict, Any, List, Tuple
+import mmap
+import hashlib
+import functools
+import concurrent.futures
+from typing import Dict, Any, List, Optional, Tuple
 
 # Basic schema for connector YAML files
 CONNECTOR_SCHEMA = {
@@ -74,25 +77,49 @@ CONNECTOR_SCHEMA = {
     }
 }
 
+# Bump whenever CONNECTOR_SCHEMA or the checks below change so cached results are discarded
+SCHEMA_VERSION = 3
+
+# Endpoint and parameter names: lowercase ASCII, digits and underscores, starting with a letter
+NAME_RE = re.compile(r'^[a-z][a-z0-9_]*$')
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".validate_cache.json")
+
+# yaml and jsonschema are imported on first use so runs answered entirely from the
+# cache (or that find no connectors) don't pay for loading them
+
+@functools.lru_cache(maxsize=None)
+def get_safe_loader() -> type:
+    """Return PyYAML's fastest available safe loader."""
+    import yaml
+    try:
+        return yaml.CSafeLoader
+    except AttributeError:  # PyYAML built without libyaml
+        return yaml.SafeLoader
+
+@functools.lru_cache(maxsize=None)
+def get_validator() -> Any:
+    """Build the schema validator once and share it with every file validated."""
+    import jsonschema
+    jsonschema.Draft7Validator.check_schema(CONNECTOR_SCHEMA)
+    return jsonschema.Draft7Validator(CONNECTOR_SCHEMA)
+
 def validate_yaml_structure(content: Dict[str, Any]) -> List[str]:
     """Validate basic YAML structure against schema."""
-    validator = jsonschema.Draft7Validator(CONNECTOR_SCHEMA)
-    return [e.message for e in validator.iter_errors(content)]
+    return [e.message for e in get_validator().iter_errors(content)]
 
 def check_naming_conventions(content: Dict[str, Any]) -> List[str]:
     """Verify naming conventions are followed."""
     errors = []
     
-    # Check endpoint names
-    for endpoint in content.get("api", {}).get("endpoints", {}):
-        if not endpoint.islower() or not endpoint.replace("_", "").isalnum():
-            errors.append(f"Endpoint name '{endpoint}' should be lowercase with underscores")
-    
-    # Check parameter names
-    for endpoint in content.get("api", {}).get("endpoints", {}).values():
+    # Check endpoint names and their parameter names in a single pass
+    for name, endpoint in content.get("api", {}).get("endpoints", {}).items():
+        if not NAME_RE.match(name):
+            errors.append(f"Endpoint name '{name}' should be lowercase with underscores")
+        
         for param in endpoint.get("params", {}):
-            if not param.islower():
-                errors.append(f"Parameter name '{param}' should be lowercase")
+            if not NAME_RE.match(param):
+                errors.append(f"Parameter name '{param}' should be lowercase with underscores")
     
     return errors
 
@@ -100,17 +127,27 @@ def check_transform_complexity(content: Dict[str, Any]) -> List[str]:
     """Check for overly complex transforms in YAML."""
     errors = []
     
-    def check_depth(obj: Any, path: str, depth: int = 0) -> None:
-        if depth > 3:  # Max allowed nesting depth for transforms
-            errors.append(f"Transform at '{path}' is too deeply nested (max depth: 3)")
-        
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                new_path = f"{path}.{key}" if path else key
-                check_depth(value, new_path, depth + 1)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                check_depth(item, f"{path}[{i}]", depth + 1)
+    def check_depth(obj: Any, path: str) -> None:
+        # Explicit stack instead of recursion: cheaper per node and safe on deep input
+        stack = [(obj, path, 0)]
+        while stack:
+            obj, path, depth = stack.pop()
+            if depth > 3:  # Max allowed nesting depth for transforms
+                errors.append(f"Transform at '{path}' is too deeply nested (max depth: 3)")
+                # Anything below this node is covered by the same error
+                continue
+            
+            if isinstance(obj, dict):
+                children = [
+                    (value, f"{path}.{key}" if path else key, depth + 1)
+                    for key, value in obj.items()
+                ]
+            elif isinstance(obj, list):
+                children = [(item, f"{path}[{i}]", depth + 1) for i, item in enumerate(obj)]
+            else:
+                continue
+            # Reversed so nodes are visited, and errors reported, in document order
+            stack.extend(reversed(children))
     
     # Check transform sections
     for endpoint in content.get("api", {}).get("endpoints", {}).values():
@@ -122,11 +159,16 @@ def check_transform_complexity(content: Dict[str, Any]) -> List[str]:
     
     return errors
 
-def validate_connector_yaml(file_path: str) -> Tuple[bool, List[str]]:
-    """Validate a connector YAML file."""
+def validate_connector_content(data: bytes) -> Tuple[bool, List[str]]:
+    """Validate the raw bytes of a connector YAML file.
+    
+    Messages never mention the file's path, so results can be cached by content.
+    """
+    import yaml
+    
     try:
-        with open(file_path, 'r') as f:
-            content = yaml.safe_load(f)
+        # Parse the bytes directly; the parser detects the encoding without a str copy
+        content = yaml.load(data, Loader=get_safe_loader())
     except Exception as e:
         return False, [f"Failed to load YAML file: {str(e)}"]
     
@@ -143,25 +185,126 @@ def validate_connector_yaml(file_path: str) -> Tuple[bool, List[str]]:
     
     return len(errors) == 0, errors
 
+def validate_connector_yaml(file_path: str) -> Tuple[bool, List[str]]:
+    """Validate a connector YAML file."""
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        return False, [f"Failed to load YAML file: {str(e)}"]
+    
+    return validate_connector_content(data)
+
+def cache_key(data: bytes) -> str:
+    """Return a cache key for a file's bytes under the current schema version."""
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    return f"{SCHEMA_VERSION}:{digest}"
+
+def read_if_stale(file_path: str, cache: Dict[str, Any]) -> Tuple[str, Optional[bytes]]:
+    """Return a file's cache key, plus its bytes when the cache has no result for it.
+    
+    The file is hashed through a read-only memory map, so for cache hits its
+    contents are never copied into Python memory.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap can't map an empty file
+            key = cache_key(b"")
+            return key, None if key in cache else b""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            key = cache_key(mm)
+            # Copied out only when the file has to be parsed (in a worker process)
+            return key, None if key in cache else mm[:]
+
+def load_cache() -> Dict[str, Any]:
+    """Load cached validation results, ignoring a missing or unreadable cache."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_cache(cache: Dict[str, Any]) -> None:
+    """Write validation results back to the cache file."""
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"⚠️  Could not write validation cache: {e}", file=sys.stderr)
+
 def main():
     """Validate all connector YAML files."""
     connectors_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "connectors")
     exit_code = 0
     
-    for root, _, files in os.walk(connectors_dir):
-        for file in files:
-            if file == "connector.yaml":
-                file_path = os.path.join(root, file)
-                print(f"\nValidating {file_path}...")
-                
-                valid, errors = validate_connector_yaml(file_path)
-                if not valid:
-                    exit_code = 1
-                    print("❌ Validation failed:")
-                    for error in errors:
-                        print(f"  - {error}")
-                else:
-                    print("✅ Validation passed")
+    # Connectors live at connectors/<name>/connector.yaml, so one directory listing
+    # finds them all without walking every file in the tree
+    with os.scandir(connectors_dir) as entries:
+        paths = [
+            path
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+            for path in [os.path.join(entry.path, "connector.yaml")]
+            if os.path.isfile(path)
+        ]
+    
+    # Each file is read once: it is hashed for the cache and, only when the cache
+    # misses, its bytes are parsed. Unchanged files are never re-parsed.
+    cache = load_cache()
+    keys: List[Optional[str]] = []
+    results: List[Optional[Tuple[bool, List[str]]]] = []
+    stale: List[Tuple[int, bytes]] = []
+    for i, path in enumerate(paths):
+        try:
+            key, data = read_if_stale(path, cache)
+        except OSError as e:
+            keys.append(None)
+            results.append((False, [f"Failed to load YAML file: {str(e)}"]))
+            continue
+        
+        keys.append(key)
+        if data is None:
+            valid, errors = cache[key]
+            results.append((valid, errors))
+        else:
+            results.append(None)
+            stale.append((i, data))
+    
+    if stale and get_safe_loader().__name__ != "CSafeLoader":
+        print(
+            "⚠️  PyYAML is running without libyaml; install a libyaml-enabled build "
+            "for faster parsing",
+            file=sys.stderr,
+        )
+    
+    # Files are independent, so validate them in parallel; a single file isn't
+    # worth the cost of starting worker processes
+    stale_data = [data for _, data in stale]
+    if len(stale) > 1:
+        workers = min(len(stale), os.cpu_count() or 1)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            fresh = list(executor.map(validate_connector_content, stale_data, chunksize=4))
+    else:
+        fresh = [validate_connector_content(data) for data in stale_data]
+    
+    if stale:
+        for (i, _), result in zip(stale, fresh):
+            results[i] = result
+            cache[keys[i]] = list(result)
+        # Keep only entries for files that still exist in their current form
+        save_cache({key: cache[key] for key in keys if key is not None})
+    
+    # Report in discovery order so output is deterministic
+    for file_path, (valid, errors) in zip(paths, results):
+        print(f"\nValidating {file_path}...")
+        if not valid:
+            exit_code = 1
+            print("❌ Validation failed:")
+            for error in errors:
+                print(f"  - {error}")
+        else:
+            print("✅ Validation passed")
     
     sys.exit(exit_code)
 